@@ -1,13 +1,18 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from dotenv import load_dotenv
 from models.schemas import AudioProcessResponse, HealthResponse, LanguageDetectionResponse, SupportedLanguagesResponse, PreciseEmotionsResponse
 from services.speech_to_text import SpeechToTextService
-from services.sentiment_analysis import SentimentAnalysisService
+from services.sentiment_analysis import SentimentAnalysisService, DEFAULT_SENTIMENT_MODEL
+from services.inference_pool import INFERENCE_POOL
 from utils.audio_processing import AudioProcessor
+import asyncio
 import os
+import orjson
 import uvicorn
 from typing import Optional
+from functools import lru_cache
 
 # Load environment variables from .env file
 load_dotenv()
@@ -16,7 +21,8 @@ load_dotenv()
 app = FastAPI(
     title="Speech-to-Text Sentiment Analysis API",
     description="API for converting speech to text and analyzing sentiment with South Indian language support and precise emotion detection",
-    version="3.0.0"
+    version="3.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS setup for frontend access
@@ -36,35 +42,50 @@ app.add_middleware(
 )
 
 # Initialize services
-stt_service = SpeechToTextService()
-sentiment_service = SentimentAnalysisService()
+# Deployments serving a single language can set it to skip Whisper's language detection
+stt_service = SpeechToTextService(default_language=os.getenv("STT_DEFAULT_LANGUAGE") or None)
+sentiment_service = SentimentAnalysisService(model_name=os.getenv("SENTIMENT_MODEL", DEFAULT_SENTIMENT_MODEL))
 audio_processor = AudioProcessor()
 
 # Create upload directory
 UPLOAD_DIR = "uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# Uploads are streamed to disk in chunks of this size instead of read whole
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+async def save_upload(audio_file: UploadFile, file_path: str) -> int:
+    """Stream an uploaded file to disk chunk by chunk and return its size in bytes"""
+    with open(file_path, "wb") as buffer:
+        while chunk := await audio_file.read(UPLOAD_CHUNK_SIZE):
+            buffer.write(chunk)
+        return buffer.tell()
+
+# Static bodies for / and /health, serialized once since they never change
+ROOT_RESPONSE_BODY = orjson.dumps({
+    "message": "Speech-to-Text Sentiment Analysis API with South Indian language support and precise emotion detection is running!",
+    "status": "healthy",
+    "version": "3.0.0"
+})
+HEALTH_RESPONSE_BODY = orjson.dumps({
+    "message": "API is healthy",
+    "status": "healthy",
+    "version": "3.0.0"
+})
+
 # --- Endpoints ---
 
 @app.get("/", response_model=HealthResponse)
 async def root():
-    return HealthResponse(
-        message="Speech-to-Text Sentiment Analysis API with South Indian language support and precise emotion detection is running!",
-        status="healthy",
-        version="3.0.0"
-    )
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
-    return HealthResponse(
-        message="API is healthy",
-        status="healthy",
-        version="3.0.0"
-    )
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
-@app.get("/api/supported-languages")
-async def get_supported_languages():
-    """Get list of supported languages for transcription and sentiment analysis"""
+@lru_cache(maxsize=1)
+def _build_supported_languages() -> dict:
+    """Build the supported-languages payload; it is fixed once the services are loaded"""
     stt_info = stt_service.get_model_info()
     sentiment_info = sentiment_service.get_analyzer_info()
     
@@ -81,9 +102,9 @@ async def get_supported_languages():
         }
     }
 
-@app.get("/api/supported-emotions")
-async def get_supported_emotions():
-    """Get list of all 23 supported precise emotions"""
+@lru_cache(maxsize=1)
+def _build_supported_emotions() -> PreciseEmotionsResponse:
+    """Build the supported-emotions payload; it is fixed once the services are loaded"""
     emotion_info = sentiment_service.get_analyzer_info()["emotion_analysis"]
     
     return PreciseEmotionsResponse(
@@ -93,16 +114,26 @@ async def get_supported_emotions():
         models_loaded=emotion_info["models_loaded"]
     )
 
+@app.get("/api/supported-languages")
+async def get_supported_languages():
+    """Get list of supported languages for transcription and sentiment analysis"""
+    return _build_supported_languages()
+
+@app.get("/api/supported-emotions")
+async def get_supported_emotions():
+    """Get list of all 23 supported precise emotions"""
+    return _build_supported_emotions()
+
 @app.post("/api/detect-language")
 async def detect_language(audio_file: UploadFile = File(...)):
     """Detect the language of an audio file"""
     try:
         file_path = os.path.join(UPLOAD_DIR, f"detect_{audio_file.filename}")
-        with open(file_path, "wb") as buffer:
-            content = await audio_file.read()
-            buffer.write(content)
+        await save_upload(audio_file, file_path)
         
-        detection_result = stt_service.detect_language(file_path)
+        # Whisper language detection blocks, so it runs on the inference pool
+        loop = asyncio.get_running_loop()
+        detection_result = await loop.run_in_executor(INFERENCE_POOL, stt_service.detect_language, file_path)
         os.remove(file_path)
         
         return {
@@ -126,14 +157,12 @@ async def upload_audio(audio_file: UploadFile = File(...)):
         if not audio_file.content_type.startswith('audio/'):
             raise HTTPException(status_code=400, detail="File must be an audio file")
         file_path = os.path.join(UPLOAD_DIR, audio_file.filename)
-        with open(file_path, "wb") as buffer:
-            content = await audio_file.read()
-            buffer.write(content)
+        file_size = await save_upload(audio_file, file_path)
         return {
             "message": "File uploaded successfully",
             "filename": audio_file.filename,
             "file_path": file_path,
-            "file_size": len(content)
+            "file_size": file_size
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error uploading file: {str(e)}")
@@ -147,9 +176,7 @@ async def transcribe_audio(
     """Transcribe audio with optional language specification"""
     try:
         file_path = os.path.join(UPLOAD_DIR, f"temp_{audio_file.filename}")
-        with open(file_path, "wb") as buffer:
-            content = await audio_file.read()
-            buffer.write(content)
+        await save_upload(audio_file, file_path)
         
         transcript = await stt_service.transcribe_audio(
             file_path, 
@@ -200,9 +227,7 @@ async def process_audio_complete(
     """Process audio with transcription and sentiment analysis including precise emotions"""
     try:
         file_path = os.path.join(UPLOAD_DIR, f"temp_{audio_file.filename}")
-        with open(file_path, "wb") as buffer:
-            content = await audio_file.read()
-            buffer.write(content)
+        await save_upload(audio_file, file_path)
 
         # Transcribe with language support
         transcript_result = await stt_service.transcribe_audio(
@@ -212,32 +237,31 @@ async def process_audio_complete(
         )
         
         # Analyze sentiment with detected/specified language
+        transcript_text = transcript_result["text"]
         detected_language = transcript_result.get("language", language)
         sentiment_result = await sentiment_service.analyze_sentiment(
-            transcript_result["text"], 
+            transcript_text, 
             language=detected_language
         )
         
         os.remove(file_path)
 
-        # Extract emotion data for response
-        emotions = sentiment_result.get("emotions", {})
-        
-        return AudioProcessResponse(
-            transcript=transcript_result["text"],
-            original_transcript=transcript_result.get("original_text", transcript_result["text"]),
-            transcript_confidence=transcript_result.get("confidence", 0.0),
-            language=detected_language,
-            language_name=transcript_result.get("language_name", "Unknown"),
-            is_south_indian_language=transcript_result.get("is_south_indian_language", False),
-            sentiment=sentiment_result["sentiment"],
-            sentiment_confidence=sentiment_result["confidence"],
-            sentiment_scores=sentiment_result["scores"],
-            processing_time=transcript_result.get("processing_time", 0.0) + sentiment_result.get("processing_time", 0.0),
-            detected_language_info=transcript_result.get("detected_language_info"),
-            sentiment_method=sentiment_result.get("method", "unknown"),
-            emotions=emotions
-        )
+        # Plain dict: FastAPI validates it once against response_model
+        return {
+            "transcript": transcript_text,
+            "original_transcript": transcript_result.get("original_text", transcript_text),
+            "transcript_confidence": transcript_result.get("confidence", 0.0),
+            "language": detected_language,
+            "language_name": transcript_result.get("language_name", "Unknown"),
+            "is_south_indian_language": transcript_result.get("is_south_indian_language", False),
+            "sentiment": sentiment_result["sentiment"],
+            "sentiment_confidence": sentiment_result["confidence"],
+            "sentiment_scores": sentiment_result["scores"],
+            "processing_time": transcript_result.get("processing_time", 0.0) + sentiment_result.get("processing_time", 0.0),
+            "detected_language_info": transcript_result.get("detected_language_info"),
+            "sentiment_method": sentiment_result.get("method", "unknown"),
+            "emotions": sentiment_result.get("emotions", {})
+        }
     except Exception as e:
         if 'file_path' in locals() and os.path.exists(file_path):
             os.remove(file_path)
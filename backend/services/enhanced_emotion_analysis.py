@@ -1,3 +1,5 @@
+import asyncio
+import threading
 import torch
 from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
 import time
@@ -6,6 +8,7 @@ import re
 import numpy as np
 from textblob import TextBlob
 import logging
+from .inference_pool import INFERENCE_POOL
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -19,6 +22,8 @@ class EnhancedEmotionAnalysisService:
         self.emotion_analyzer = None
         self.backup_analyzer = None
         self.text_analyzer = None
+        # Pipelines run on inference pool threads and are not safe to call concurrently
+        self._pipeline_lock = threading.Lock()
         
         # Enhanced 23 precise emotions with better mapping
         self.precise_emotions = {
@@ -64,7 +69,7 @@ class EnhancedEmotionAnalysisService:
                 )
                 logger.info("Primary GoEmotions model loaded successfully!")
             except Exception as e:
-                logger.warning(f"Could not load primary emotion model: {e}")
+                logger.warning("Could not load primary emotion model: %s", e)
             
             # Backup model - RoBERTa emotion
             try:
@@ -76,14 +81,14 @@ class EnhancedEmotionAnalysisService:
                 )
                 logger.info("Backup emotion model loaded successfully!")
             except Exception as e:
-                logger.warning(f"Could not load backup emotion model: {e}")
+                logger.warning("Could not load backup emotion model: %s", e)
                 
             # Text analysis for linguistic features
             self.text_analyzer = TextBlob
             logger.info("Text analysis tools loaded successfully!")
                 
         except Exception as e:
-            logger.error(f"Error loading emotion analyzers: {e}")
+            logger.error("Error loading emotion analyzers: %s", e)
     
     def _enhanced_keyword_analysis(self, text: str) -> Dict[str, float]:
         """
@@ -150,7 +155,7 @@ class EnhancedEmotionAnalysisService:
                     emotion_scores[emotion] *= (1 + subjectivity * 0.5)
                     
         except Exception as e:
-            logger.warning(f"TextBlob analysis failed: {e}")
+            logger.warning("TextBlob analysis failed: %s", e)
         
         return emotion_scores
     
@@ -223,7 +228,8 @@ class EnhancedEmotionAnalysisService:
         # Method 1: Primary emotion model
         if self.emotion_analyzer:
             try:
-                model_result = self.emotion_analyzer(text)
+                with self._pipeline_lock:
+                    model_result = self.emotion_analyzer(text)
                 precise_scores = self._map_model_emotions_enhanced(model_result)
                 results.append({
                     "scores": precise_scores,
@@ -232,12 +238,13 @@ class EnhancedEmotionAnalysisService:
                     "confidence": max(precise_scores.values()) if precise_scores else 0
                 })
             except Exception as e:
-                logger.warning(f"Primary model analysis failed: {e}")
+                logger.warning("Primary model analysis failed: %s", e)
         
         # Method 2: Backup emotion model
         if self.backup_analyzer:
             try:
-                model_result = self.backup_analyzer(text)
+                with self._pipeline_lock:
+                    model_result = self.backup_analyzer(text)
                 precise_scores = self._map_model_emotions_enhanced(model_result)
                 results.append({
                     "scores": precise_scores,
@@ -246,7 +253,7 @@ class EnhancedEmotionAnalysisService:
                     "confidence": max(precise_scores.values()) if precise_scores else 0
                 })
             except Exception as e:
-                logger.warning(f"Backup model analysis failed: {e}")
+                logger.warning("Backup model analysis failed: %s", e)
         
         # Method 3: Enhanced keyword analysis
         try:
@@ -258,7 +265,7 @@ class EnhancedEmotionAnalysisService:
                 "confidence": max(keyword_scores.values()) if keyword_scores else 0
             })
         except Exception as e:
-            logger.warning(f"Keyword analysis failed: {e}")
+            logger.warning("Keyword analysis failed: %s", e)
         
         # Combine results with adaptive weighting
         if not results:
@@ -292,8 +299,9 @@ class EnhancedEmotionAnalysisService:
         start_time = time.time()
         
         try:
-            # Get combined emotion scores
-            emotion_scores = self._combine_analysis_methods(text)
+            # Get combined emotion scores, running the models off the event loop
+            loop = asyncio.get_running_loop()
+            emotion_scores = await loop.run_in_executor(INFERENCE_POOL, self._combine_analysis_methods, text)
             
             # Determine primary emotion with confidence threshold
             primary_emotion = max(emotion_scores, key=emotion_scores.get)
@@ -326,7 +334,7 @@ class EnhancedEmotionAnalysisService:
             }
             
         except Exception as e:
-            logger.error(f"Error in enhanced emotion analysis: {e}")
+            logger.error("Error in enhanced emotion analysis: %s", e)
             return self._get_error_response(str(e), language, time.time() - start_time)
     
     def _get_top_emotions(self, scores: Dict[str, float], top_n: int = 5) -> List[Dict[str, Any]]:
@@ -346,6 +354,30 @@ class EnhancedEmotionAnalysisService:
         
         return top_emotions
     
+    def get_fixed_response(self, emotion: str, language: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get the response for a short reply whose emotion comes from a lookup table
+
+        The emotion is not scored by the models, so confidence is the same 0.5
+        analyze_emotions reports when no emotion clears its threshold.
+        """
+        confidence = 0.5
+        emotion_info = self.precise_emotions[emotion]
+        emotion_scores = {name: 0.0 for name in self.precise_emotions.keys()}
+        emotion_scores[emotion] = confidence
+        return {
+            "primary_emotion": emotion,
+            "emotion_scores": emotion_scores,
+            "confidence": confidence,
+            "category": emotion_info["category"],
+            "intensity": emotion_info["intensity"],
+            "processing_time": 0.0,
+            "language": language or "unknown",
+            "method": "short_reply_lookup",
+            "top_emotions": self._get_top_emotions(emotion_scores, 5),
+            "analysis_quality": "medium"
+        }
+    
     def _get_default_response(self, language: Optional[str] = None) -> Dict[str, Any]:
         """Get default response for empty text"""
         return {
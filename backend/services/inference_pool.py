@@ -0,0 +1,16 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import torch
+
+# Blocking model calls run here instead of on the event loop; shared by all services so
+# concurrent requests can't start more inference threads than the machine has cores for
+INFERENCE_WORKERS = min(4, os.cpu_count() or 1)
+INFERENCE_POOL = ThreadPoolExecutor(max_workers=INFERENCE_WORKERS, thread_name_prefix="inference")
+
+# Split the cores between the workers so parallel forwards don't oversubscribe the CPU
+torch.set_num_threads(max(1, (os.cpu_count() or 1) // INFERENCE_WORKERS))
+try:
+    torch.set_num_interop_threads(1)
+except RuntimeError:
+    # Only allowed before torch has started any inter-op parallel work
+    pass
@@ -0,0 +1,501 @@
+import importlib.util
+import os
+import re
+import xml.etree.ElementTree as ElementTree
+from typing import Dict, List, Optional
+import numpy as np
+from vaderSentiment.vaderSentiment import (
+    SentimentIntensityAnalyzer,
+    SentiText,
+    BOOSTER_DICT,
+    NEGATE,
+    N_SCALAR,
+    C_INCR,
+    SPECIAL_CASES,
+    allcap_differential,
+    scalar_inc_dec
+)
+
+# Tokenization rules of TextBlob's default tokenizer
+_TEXTBLOB_PUNCTUATION = tuple(",;:!?()[]{}`''\"@#$^&*+-|=~_")
+_TEXTBLOB_QUOTES = str.maketrans({quote: f" {quote} " for quote in "'\"\u201c\u201d\u2018\u2019"})
+_TEXTBLOB_ABBREVIATIONS = frozenset((
+    "a.", "adj.", "adv.", "al.", "a.m.", "c.", "cf.", "comp.", "conf.", "def.",
+    "ed.", "e.g.", "esp.", "etc.", "ex.", "f.", "fig.", "gen.", "id.", "i.e.",
+    "int.", "l.", "m.", "Med.", "Mil.", "Mr.", "n.", "n.q.", "orig.", "pl.",
+    "pred.", "pres.", "p.m.", "ref.", "v.", "vs.", "w/"
+))
+_TEXTBLOB_ABBREVIATION = re.compile(r"^[A-Za-z]\.$|^([A-Za-z]\.)+$|^[A-Z][bcdfghjklmnpqrstvwxz]+.$")
+
+
+# VADER's compound normalization constant
+_NORMALIZE_ALPHA = 15
+
+# (positive, negative, neutral) scores of the short reply groups below
+_STRONG_POSITIVE = (0.9, 0.02, 0.08)
+_ACKNOWLEDGEMENT = (0.35, 0.05, 0.6)
+_NEUTRAL = (0.1, 0.1, 0.8)
+_STRONG_NEGATIVE = (0.02, 0.9, 0.08)
+_MILD_NEGATIVE = (0.05, 0.6, 0.35)
+
+# Fixed (positive, negative, neutral, emotion) for common short replies, keyed by lowercased
+# text. These carry too little context for a model to add anything over a lookup. Negated
+# phrases ("not good", "not sure") are left to the analyzers; fixed idioms such as
+# "no problem" are kept. Emotions are names from EnhancedEmotionAnalysisService.precise_emotions.
+SHORT_REPLY_SENTIMENTS = {
+    text: (*scores, emotion)
+    for scores, emotion, texts in (
+        (_STRONG_POSITIVE, "gratitude", (
+            "thanks", "thank you", "thanks a lot", "thank you so much", "thx", "ty", "tysm",
+            "appreciate it", "much appreciated", "cheers", "🙏"
+        )),
+        (_STRONG_POSITIVE, "admiration", (
+            "great", "awesome", "amazing", "perfect", "excellent", "wonderful", "fantastic",
+            "brilliant", "superb", "nice", "very nice", "cool", "good", "very good", "so good",
+            "best", "the best", "beautiful", "sweet", "👏", "💯", "🔥"
+        )),
+        (_STRONG_POSITIVE, "pride", (
+            "good job", "great job", "well done", "congrats", "congratulations"
+        )),
+        (_STRONG_POSITIVE, "love", (
+            "love it", "love this", "i love it", "love", "😍", "🥰", "❤️", "❤", "💕"
+        )),
+        (_STRONG_POSITIVE, "happy", (
+            "glad", "happy", "yay", "lol", "haha", "hahaha", "lmao",
+            "😀", "😃", "😄", "😁", "😆", "😊", "🙂", "😎", "😂", "🤣", "🎉", "😇", "🤗"
+        )),
+        (_STRONG_POSITIVE, "satisfaction", ("👍", "✅")),
+        (_ACKNOWLEDGEMENT, "gratitude", ("ok thanks", "okay thanks")),
+        (_ACKNOWLEDGEMENT, "satisfaction", ("sounds good", "👌")),
+        (_ACKNOWLEDGEMENT, "mildness", (
+            "ok", "okay", "k", "kk", "sure", "fine", "alright", "all right", "got it", "noted",
+            "np", "no problem", "no worries", "of course", "agreed", "right", "correct", "true"
+        )),
+        (_NEUTRAL, "boredom", ("meh", "so so", "whatever")),
+        (_NEUTRAL, "mildness", (
+            "yes", "yep", "yeah", "yup", "no", "nope", "nah", "maybe", "hmm", "hm", "idk",
+            "hi", "hello", "hey", "bye", "goodbye", "see you", "good morning", "good night",
+            "what", "why", "how", "when", "where", "who", "?", "...", "😐", "😶", "🤔"
+        )),
+        (_STRONG_NEGATIVE, "disappointment", (
+            "bad", "very bad", "so bad", "terrible", "awful", "horrible", "worst", "the worst",
+            "disappointed", "disappointing", "sucks", "this sucks", "useless", "poor",
+            "broken", "fail", "failed", "😞", "👎"
+        )),
+        (_STRONG_NEGATIVE, "hate", ("hate it", "hate this", "i hate it")),
+        (_STRONG_NEGATIVE, "sad", ("sad", "😢", "😭", "😔", "🙁", "☹️", "💔")),
+        (_STRONG_NEGATIVE, "angry", ("angry", "wtf", "😡", "😠", "😤")),
+        (_STRONG_NEGATIVE, "anger", ("annoyed", "ugh", "damn")),
+        (_STRONG_NEGATIVE, "reproach", ("wrong", "😒")),
+        (_STRONG_NEGATIVE, "distress", ("😩",)),
+        (_STRONG_NEGATIVE, "boredom", ("boring",)),
+        (_MILD_NEGATIVE, "mildness", ("no thanks",)),
+        (_MILD_NEGATIVE, "pity", ("too bad",)),
+        (_MILD_NEGATIVE, "distress", ("oh no",)),
+        (_MILD_NEGATIVE, "reproach", ("🙄",))
+    )
+    for text in texts
+}
+
+def _round(values: np.ndarray, digits: int) -> np.ndarray:
+    """Round like Python's round(), which np.round differs from on some halves"""
+    return np.fromiter((round(value, digits) for value in values.tolist()), dtype=np.float64, count=len(values))
+
+def _owners(lengths: np.ndarray) -> np.ndarray:
+    """Map every token of a flattened batch back to the index of its text"""
+    return np.repeat(np.arange(len(lengths)), lengths)
+
+class FastSentimentIntensityAnalyzer(SentimentIntensityAnalyzer):
+    """
+    VADER analyzer that scores with the same rules but less per-call work
+
+    Tokenization, emoji handling and every valence rule (boosters, negation,
+    "no", "least", capitalization, idioms, "but" clauses and punctuation
+    emphasis) follow vaderSentiment. The difference is that each text is
+    lowercased once and only sentiment-bearing tokens are inspected, instead of
+    rebuilding lowercased token lists inside every rule check.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._negations = frozenset(NEGATE)
+
+    def _is_negation(self, word: str) -> bool:
+        """Check whether a lowercased token negates the sentiment that follows it"""
+        return word in self._negations or "n't" in word
+
+    def _replace_emojis(self, text: str) -> str:
+        """Replace emoji with their textual descriptions, as VADER does"""
+        text_no_emoji = []
+        prev_space = True
+        for char in text:
+            description = self.emojis.get(char)
+            if description is not None:
+                if not prev_space:
+                    text_no_emoji.append(" ")
+                text_no_emoji.append(description)
+                prev_space = False
+            else:
+                text_no_emoji.append(char)
+                prev_space = char == " "
+        return "".join(text_no_emoji).strip()
+
+    def token_valences(self, text: str) -> np.ndarray:
+        """
+        Get the valence of every token in the text
+
+        Args:
+            text: Text to score
+
+        Returns:
+            Array with one valence per token (0.0 for neutral tokens)
+        """
+        # Emoji are all non-ASCII, so plain ASCII text can skip the per-character scan
+        if not text.isascii():
+            text = self._replace_emojis(text)
+        tokens = [SentiText._strip_punc_if_word(token) for token in text.split()]
+        lowered = [token.lower() for token in tokens]
+        is_cap_diff = allcap_differential(tokens)
+        lexicon = self.lexicon
+
+        valences = [0.0] * len(tokens)
+        for i, word in enumerate(lowered):
+            # Boosters and "kind of" only modify their neighbours
+            if word not in lexicon or word in BOOSTER_DICT:
+                continue
+            if word == "kind" and i < len(lowered) - 1 and lowered[i + 1] == "of":
+                continue
+            valences[i] = self._word_valence(tokens, lowered, i, is_cap_diff)
+
+        if "but" in lowered:
+            valences = self._but_check(lowered, valences)
+
+        return np.array(valences, dtype=np.float64)
+
+    def _word_valence(self, tokens: List[str], lowered: List[str], i: int, is_cap_diff: bool) -> float:
+        """Apply VADER's context rules to the lexicon word at position i"""
+        lexicon = self.lexicon
+        word = lowered[i]
+        valence = lexicon[word]
+
+        # "no" before another lexicon word negates it instead of counting on its own
+        if word == "no" and i != len(lowered) - 1 and lowered[i + 1] in lexicon:
+            valence = 0.0
+        if (i > 0 and lowered[i - 1] == "no") \
+                or (i > 1 and lowered[i - 2] == "no") \
+                or (i > 2 and lowered[i - 3] == "no" and lowered[i - 1] in ("or", "nor")):
+            valence = lexicon[word] * N_SCALAR
+
+        # Emphasis from a word in ALL CAPS among lowercase ones
+        if tokens[i].isupper() and is_cap_diff:
+            valence = valence + C_INCR if valence > 0 else valence - C_INCR
+
+        for start_i in range(3):
+            previous = i - (start_i + 1)
+            if i > start_i and lowered[previous] not in lexicon:
+                scalar = scalar_inc_dec(tokens[previous], valence, is_cap_diff)
+                if start_i == 1 and scalar != 0:
+                    scalar = scalar * 0.95
+                if start_i == 2 and scalar != 0:
+                    scalar = scalar * 0.9
+                valence = valence + scalar
+                valence = self._negation_rule(valence, lowered, start_i, i)
+                if start_i == 2:
+                    valence = self._idiom_rule(valence, lowered, i)
+
+        return self._least_rule(valence, lowered, i)
+
+    def _negation_rule(self, valence: float, lowered: List[str], start_i: int, i: int) -> float:
+        """VADER's _negation_check on an already lowercased token list"""
+        if start_i == 0:
+            if self._is_negation(lowered[i - 1]):
+                valence = valence * N_SCALAR
+        elif start_i == 1:
+            if lowered[i - 2] == "never" and lowered[i - 1] in ("so", "this"):
+                valence = valence * 1.25
+            elif lowered[i - 2] == "without" and lowered[i - 1] == "doubt":
+                pass
+            elif self._is_negation(lowered[i - 2]):
+                valence = valence * N_SCALAR
+        else:
+            if (lowered[i - 3] == "never" and lowered[i - 2] in ("so", "this")) \
+                    or lowered[i - 1] in ("so", "this"):
+                valence = valence * 1.25
+            elif lowered[i - 3] == "without" and "doubt" in (lowered[i - 2], lowered[i - 1]):
+                pass
+            elif self._is_negation(lowered[i - 3]):
+                valence = valence * N_SCALAR
+        return valence
+
+    def _idiom_rule(self, valence: float, lowered: List[str], i: int) -> float:
+        """VADER's _special_idioms_check on an already lowercased token list"""
+        one_zero = f"{lowered[i - 1]} {lowered[i]}"
+        two_one_zero = f"{lowered[i - 2]} {lowered[i - 1]} {lowered[i]}"
+        two_one = f"{lowered[i - 2]} {lowered[i - 1]}"
+        three_two_one = f"{lowered[i - 3]} {lowered[i - 2]} {lowered[i - 1]}"
+        three_two = f"{lowered[i - 3]} {lowered[i - 2]}"
+
+        for sequence in (one_zero, two_one_zero, two_one, three_two_one, three_two):
+            if sequence in SPECIAL_CASES:
+                valence = SPECIAL_CASES[sequence]
+                break
+
+        if len(lowered) - 1 > i:
+            zero_one = f"{lowered[i]} {lowered[i + 1]}"
+            if zero_one in SPECIAL_CASES:
+                valence = SPECIAL_CASES[zero_one]
+        if len(lowered) - 1 > i + 1:
+            zero_one_two = f"{lowered[i]} {lowered[i + 1]} {lowered[i + 2]}"
+            if zero_one_two in SPECIAL_CASES:
+                valence = SPECIAL_CASES[zero_one_two]
+
+        # Booster bi-grams such as "sort of" or "kind of"
+        for n_gram in (three_two_one, three_two, two_one):
+            if n_gram in BOOSTER_DICT:
+                valence = valence + BOOSTER_DICT[n_gram]
+        return valence
+
+    def _least_rule(self, valence: float, lowered: List[str], i: int) -> float:
+        """VADER's _least_check on an already lowercased token list"""
+        if i > 1 and lowered[i - 1] not in self.lexicon and lowered[i - 1] == "least":
+            if lowered[i - 2] != "at" and lowered[i - 2] != "very":
+                valence = valence * N_SCALAR
+        elif i > 0 and lowered[i - 1] not in self.lexicon and lowered[i - 1] == "least":
+            valence = valence * N_SCALAR
+        return valence
+
+    def score_batch(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Score a batch of texts in one pass over their flattened token valences
+
+        Args:
+            texts: Texts to score
+
+        Returns:
+            Dictionary of neg, neu, pos and compound arrays with one entry per text
+        """
+        count = len(texts)
+        valences = [self.token_valences(text) for text in texts]
+        lengths = np.fromiter((len(v) for v in valences), dtype=np.intp, count=count)
+        flat = np.concatenate(valences) if count else np.zeros(0, dtype=np.float64)
+        owners = _owners(lengths)
+        punct_emph_amplifier = np.fromiter(
+            (self._punctuation_emphasis(text) for text in texts), dtype=np.float64, count=count
+        )
+
+        # bincount gives integer results for empty inputs, so cast explicitly
+        sum_s = np.bincount(owners, weights=flat, minlength=count).astype(np.float64)
+        sum_s += np.sign(sum_s) * punct_emph_amplifier
+        compound = np.clip(sum_s / np.sqrt(sum_s * sum_s + _NORMALIZE_ALPHA), -1.0, 1.0)
+
+        # Neutral tokens count as 1, so sentiment tokens are shifted by 1 away from zero
+        positive = flat > 0
+        negative = flat < 0
+        pos_sum = np.bincount(owners[positive], weights=flat[positive] + 1.0, minlength=count).astype(np.float64)
+        neg_sum = np.bincount(owners[negative], weights=flat[negative] - 1.0, minlength=count).astype(np.float64)
+        neu_count = lengths - np.bincount(owners[positive | negative], minlength=count)
+
+        pos_dominant = pos_sum > -neg_sum
+        neg_dominant = pos_sum < -neg_sum
+        pos_sum += np.where(pos_dominant, punct_emph_amplifier, 0.0)
+        neg_sum -= np.where(neg_dominant, punct_emph_amplifier, 0.0)
+
+        # Texts without tokens score 0 everywhere, as in VADER
+        total = pos_sum - neg_sum + neu_count
+        safe_total = np.where(total > 0, total, 1.0)
+        return {
+            "neg": _round(np.abs(neg_sum / safe_total), 3),
+            "neu": _round(neu_count / safe_total, 3),
+            "pos": _round(pos_sum / safe_total, 3),
+            "compound": _round(compound, 4)
+        }
+
+    def polarity_scores(self, text: str) -> Dict[str, float]:
+        """
+        Score text with the same output keys as VADER's polarity_scores
+
+        Args:
+            text: Text to score
+
+        Returns:
+            Dictionary with neg, neu, pos and compound scores
+        """
+        return {name: float(values[0]) for name, values in self.score_batch([text]).items()}
+
+class LexiconPolarityAnalyzer:
+    """
+    TextBlob-compatible polarity scoring with a packed NumPy lexicon
+
+    Uses the lexicon that ships with TextBlob and the same assessment rules as
+    TextBlob's pattern analyzer: an adverb multiplies the next known word by its
+    intensity ("very good"), a negation turns it slightly opposite ("not good")
+    and "!" boosts it. The TextBlob object, sentence splitter and tagger are
+    skipped; emoticons are not scored.
+    """
+
+    def __init__(self, lexicon_path: Optional[str] = None):
+        """
+        Load the lexicon into a word index and float64 polarity and intensity arrays
+
+        Args:
+            lexicon_path: Path to a pattern sentiment XML file, defaults to TextBlob's
+        """
+        senses = {}
+        root = ElementTree.parse(lexicon_path or self._default_lexicon_path()).getroot()
+        for word in root.iter("word"):
+            form = word.get("form")
+            if form:
+                senses.setdefault(form, {}).setdefault(word.get("pos"), []).append(
+                    (float(word.get("polarity", 0.0)), float(word.get("intensity", 1.0)))
+                )
+
+        # Average the senses per part-of-speech tag, then over the tags, as TextBlob does
+        entries = {}
+        for form, tags in senses.items():
+            entries[form] = {pos: [sum(values) / len(values) for values in zip(*psi)] for pos, psi in tags.items()}
+            entries[form][None] = [sum(values) / len(values) for values in zip(*entries[form].values())]
+
+        # Derive adverbs from adjectives ("terrible" -> "terribly"), as TextBlob does
+        for form, tags in list(entries.items()):
+            if "JJ" in tags:
+                if form.endswith("y"):
+                    form = form[:-1] + "i"
+                if form.endswith("le"):
+                    form = form[:-2]
+                adverb = entries.setdefault(form + "ly", {})
+                adverb["RB"] = adverb[None] = tags["JJ"]
+
+        self.word_ids = {form: i for i, form in enumerate(entries)}
+        self.polarity = np.array([tags[None][0] for tags in entries.values()], dtype=np.float64)
+        self.intensity = np.array([tags[None][1] for tags in entries.values()], dtype=np.float64)
+        # Adverbs modify the word that follows them
+        self.is_modifier = np.array(["RB" in tags for tags in entries.values()], dtype=bool)
+        self._negations = frozenset(("no", "not", "n't", "never"))
+
+    @staticmethod
+    def _default_lexicon_path() -> str:
+        """Locate TextBlob's bundled lexicon without importing TextBlob itself"""
+        spec = importlib.util.find_spec("textblob")
+        if spec is None or not spec.submodule_search_locations:
+            raise ImportError("textblob is required for its sentiment lexicon")
+        return os.path.join(spec.submodule_search_locations[0], "en", "en-sentiment.xml")
+
+    @staticmethod
+    def _tokenize(text: str) -> List[str]:
+        """
+        Split text into lowercased tokens the way TextBlob's tokenizer does
+
+        Contractions and quotes are split off ("can't" -> "ca n ' t") and
+        punctuation is split from the start and end of words, except for the
+        period of an abbreviation ("e.g.").
+        """
+        tokens = []
+        for token in text.replace("n't", " n't").translate(_TEXTBLOB_QUOTES).split():
+            while token.startswith(_TEXTBLOB_PUNCTUATION):
+                tokens.append(token[0])
+                token = token[1:]
+            tail = []
+            while token.endswith(_TEXTBLOB_PUNCTUATION + (".",)):
+                if token.endswith("..."):
+                    tail.append("...")
+                    token = token[:-3].rstrip(".")
+                elif token.endswith("."):
+                    if token in _TEXTBLOB_ABBREVIATIONS or _TEXTBLOB_ABBREVIATION.match(token):
+                        break
+                    tail.append(".")
+                    token = token[:-1]
+                else:
+                    tail.append(token[-1])
+                    token = token[:-1]
+            if token:
+                tokens.append(token)
+            tokens.extend(reversed(tail))
+        return [token.lower() for token in tokens]
+
+    def assessments(self, text: str) -> List[float]:
+        """
+        Get the polarity of every assessed chunk of the text
+
+        A chunk is a known word, optionally preceded by a modifier ("very good")
+        and/or a negation ("not good"), so modifiers are not averaged in on
+        their own.
+
+        Args:
+            text: Text to score
+
+        Returns:
+            One polarity per chunk, in text order
+        """
+        polarities = []
+        intensities = []
+        negated = []
+        modifier = None
+        negation = None
+        word_ids = self.word_ids
+        for token in self._tokenize(text):
+            word_id = word_ids.get(token)
+            if word_id is not None:
+                if modifier is None:
+                    polarities.append(self.polarity[word_id])
+                    intensities.append(self.intensity[word_id])
+                    negated.append(False)
+                else:
+                    polarities[-1] = max(-1.0, min(self.polarity[word_id] * intensities[-1], 1.0))
+                    intensities[-1] = self.intensity[word_id]
+                if negation is not None:
+                    intensities[-1] = 1.0 / intensities[-1]
+                    negated[-1] = True
+                modifier = token if self.is_modifier[word_id] else None
+                negation = token if token in self._negations else None
+            else:
+                if token in self._negations:
+                    negation = token
+                # Negations carry over one-letter words ("not a good")
+                elif negation and len(token.strip("'")) > 1:
+                    negation = None
+                # A negation after an adverb negates the adverb's chunk ("really not good")
+                if negation is not None and modifier is not None and modifier.endswith("ly"):
+                    negated[-1] = True
+                    negation = None
+                # Modifiers carry over short words ("really is a good")
+                elif modifier and len(token) > 2:
+                    modifier = None
+                if token == "!" and polarities:
+                    polarities[-1] = max(-1.0, min(polarities[-1] * 1.25, 1.0))
+
+        # "not good" is slightly bad and "not bad" slightly good
+        return [polarity * -0.5 if is_negated else polarity for polarity, is_negated in zip(polarities, negated)]
+
+    def polarity_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Get the polarity of a batch of texts
+
+        Args:
+            texts: Texts to score
+
+        Returns:
+            Mean polarity of the assessed chunks per text, between -1.0 and 1.0
+            (0.0 for texts without known words)
+        """
+        count = len(texts)
+        chunks = [self.assessments(text) for text in texts]
+        lengths = np.fromiter((len(polarities) for polarities in chunks), dtype=np.intp, count=count)
+        flat = np.fromiter(
+            (polarity for polarities in chunks for polarity in polarities),
+            dtype=np.float64,
+            count=int(lengths.sum())
+        )
+        sums = np.bincount(_owners(lengths), weights=flat, minlength=count)
+        return np.divide(sums, lengths, out=np.zeros(count), where=lengths > 0)
+
+    def polarity_scores(self, text: str) -> float:
+        """
+        Get the polarity of the text
+
+        Args:
+            text: Text to score
+
+        Returns:
+            Mean polarity of the assessed chunks, between -1.0 and 1.0 (0.0 if none)
+        """
+        return float(self.polarity_batch([text])[0])
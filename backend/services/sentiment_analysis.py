@@ -1,23 +1,67 @@
 from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
-from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+import asyncio
+import copy
+import os
+import threading
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
+from collections import OrderedDict
+import numpy as np
 import torch
 import re
 from .enhanced_emotion_analysis import EnhancedEmotionAnalysisService
+from .lexicon_sentiment import FastSentimentIntensityAnalyzer, LexiconPolarityAnalyzer, SHORT_REPLY_SENTIMENTS
+from .inference_pool import INFERENCE_POOL
+
+# Dynamically quantized INT8 ONNX exports are cached here so they are only built once
+QUANTIZED_MODEL_DIR = os.getenv("QUANTIZED_MODEL_DIR", "quantized_models")
+QUANTIZED_MODEL_FILE = "model_quantized.onnx"
+
+# Distilled multilingual sentiment model with 6 transformer layers, half of RoBERTa-base's 12
+DEFAULT_SENTIMENT_MODEL = "lxyuan/distilbert-base-multilingual-cased-sentiments-student"
+
+# Model labels mapped to standard format; other labels are lowercased
+SENTIMENT_LABEL_MAP = {
+    "LABEL_0": "negative",  # RoBERTa
+    "LABEL_1": "neutral",
+    "LABEL_2": "positive",
+    "NEGATIVE": "negative",  # Other models, including two-class SST-2 models
+    "NEUTRAL": "neutral",
+    "POSITIVE": "positive"
+}
+
+# Longer texts are rare repeats and are not worth keeping in the result cache
+MAX_CACHED_TEXT_LENGTH = 512
 
 class SentimentAnalysisService:
-    def __init__(self, method: str = "transformers"):
+    def __init__(self, method: str = "transformers", max_batch_size: int = 32,
+                 max_batch_delay: float = 0.005, cache_size: int = 4096,
+                 model_name: str = DEFAULT_SENTIMENT_MODEL):
         """
         Initialize sentiment analysis service with enhanced emotion analysis
         
         Args:
             method: "transformers", "textblob", or "vader"
+            max_batch_size: Maximum number of texts analyzed in one batched call
+            max_batch_delay: Seconds to wait for more texts before running a batch
+            cache_size: Number of sentiment results kept in the LRU cache
+            model_name: Hugging Face model used by the "transformers" method
         """
         self.method = method
+        self.model_name = model_name
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        self._batch_queue = None
+        self._batch_worker_task = None
+        self._batch_loop = None
+        self.cache_size = cache_size
+        self._result_cache = OrderedDict()
+        # Rust tokenizers raise if two threads use the same instance at once
+        self._tokenizer_lock = threading.Lock()
         self.analyzer = None
+        self._analyze_batch_fn = None
         self.multilingual_analyzer = None
+        self.vader_analyzer = None
         self.emotion_service = EnhancedEmotionAnalysisService()
         self.south_indian_languages = {
             'ta': 'Tamil',
@@ -29,28 +73,23 @@ class SentimentAnalysisService:
     
     def _load_analyzer(self):
         """Load the sentiment analysis model/analyzer"""
+        # Cached results belong to the previous analyzer
+        self._result_cache.clear()
+        
+        # VADER backs the "vader" method and the South Indian fallback, so it is always loaded
+        self.vader_analyzer = FastSentimentIntensityAnalyzer()
+        
         try:
             if self.method == "transformers":
                 print("Loading transformer models for sentiment analysis...")
                 
-                # Primary English model
-                model_name = "cardiffnlp/twitter-roberta-base-sentiment-latest"
-                self.analyzer = pipeline(
-                    "sentiment-analysis",
-                    model=model_name,
-                    tokenizer=model_name,
-                    device=0 if torch.cuda.is_available() else -1
-                )
+                # Primary model
+                self.analyzer = self._build_sentiment_pipeline(self.model_name)
                 
                 # Multilingual model for better cross-language support
                 try:
                     multilingual_model = "cardiffnlp/twitter-xlm-roberta-base-sentiment"
-                    self.multilingual_analyzer = pipeline(
-                        "sentiment-analysis",
-                        model=multilingual_model,
-                        tokenizer=multilingual_model,
-                        device=0 if torch.cuda.is_available() else -1
-                    )
+                    self.multilingual_analyzer = self._build_sentiment_pipeline(multilingual_model)
                     print("Multilingual sentiment model loaded successfully!")
                 except Exception as e:
                     print(f"Could not load multilingual model: {e}")
@@ -60,13 +99,13 @@ class SentimentAnalysisService:
                 
             elif self.method == "vader":
                 print("Loading VADER sentiment analyzer...")
-                self.analyzer = SentimentIntensityAnalyzer()
+                self.analyzer = self.vader_analyzer
                 print("VADER analyzer loaded successfully!")
                 
             elif self.method == "textblob":
-                print("Using TextBlob for sentiment analysis...")
-                self.analyzer = "textblob"
-                print("TextBlob ready!")
+                print("Loading TextBlob sentiment lexicon...")
+                self.analyzer = LexiconPolarityAnalyzer()
+                print("TextBlob lexicon loaded successfully!")
                 
         except Exception as e:
             print(f"Error loading sentiment analyzer: {e}")
@@ -74,7 +113,84 @@ class SentimentAnalysisService:
             if self.method == "transformers":
                 print("Falling back to VADER...")
                 self.method = "vader"
-                self.analyzer = SentimentIntensityAnalyzer()
+                self.analyzer = self.vader_analyzer
+        
+        # Resolve the batch analyzer once here instead of comparing method names on every batch
+        self._analyze_batch_fn = getattr(self, f"_analyze_batch_with_{self.method}", None)
+    
+    def _build_sentiment_pipeline(self, model_name: str):
+        """
+        Build a sentiment pipeline, preferring an INT8 ONNX Runtime model on CPU
+        
+        Args:
+            model_name: Hugging Face model name
+            
+        Returns:
+            Transformers sentiment-analysis pipeline
+        """
+        if not torch.cuda.is_available():
+            try:
+                return pipeline(
+                    "sentiment-analysis",
+                    model=self._load_quantized_model(model_name),
+                    tokenizer=AutoTokenizer.from_pretrained(model_name, use_fast=True)
+                )
+            except Exception as e:
+                print(f"Could not load INT8 ONNX model for {model_name}: {e}")
+                print("Falling back to the PyTorch model")
+        
+        classifier = pipeline(
+            "sentiment-analysis",
+            model=model_name,
+            tokenizer=AutoTokenizer.from_pretrained(model_name, use_fast=True),
+            device=0 if torch.cuda.is_available() else -1
+        )
+        return self._compile_pipeline_model(classifier)
+    
+    def _compile_pipeline_model(self, classifier):
+        """
+        Compile the PyTorch model behind a pipeline with torch.compile
+        
+        Args:
+            classifier: Transformers pipeline wrapping a PyTorch model
+            
+        Returns:
+            The same pipeline, using the compiled model if compilation succeeded
+        """
+        eager_model = classifier.model
+        try:
+            # dynamic=True avoids recompiling for every new sequence length / batch size
+            classifier.model = torch.compile(eager_model, dynamic=True)
+            # Compilation happens on the first forward
+            self._predict_label_scores(classifier, ["Warming up the compiled model."])
+        except Exception as e:
+            print(f"Could not compile sentiment model, using eager mode: {e}")
+            classifier.model = eager_model
+        return classifier
+    
+    def _load_quantized_model(self, model_name: str):
+        """
+        Load a dynamically quantized INT8 ONNX export of the model, creating it on first use
+        
+        Args:
+            model_name: Hugging Face model name
+            
+        Returns:
+            ONNX Runtime sequence classification model
+        """
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        
+        save_dir = os.path.join(QUANTIZED_MODEL_DIR, model_name.replace("/", "--"))
+        if not os.path.exists(os.path.join(save_dir, QUANTIZED_MODEL_FILE)):
+            print(f"Quantizing {model_name} to INT8 ONNX (one-time)...")
+            onnx_model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+            quantizer = ORTQuantizer.from_pretrained(onnx_model)
+            # Dynamic quantization: INT8 weights, activations quantized on the fly (VNNI dot products)
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=save_dir, quantization_config=qconfig)
+        
+        return ORTModelForSequenceClassification.from_pretrained(save_dir, file_name=QUANTIZED_MODEL_FILE)
     
     def _detect_language(self, text: str) -> str:
         """
@@ -142,7 +258,7 @@ class SentimentAnalysisService:
         # Approach 1: Use multilingual model if available
         if self.multilingual_analyzer:
             try:
-                result = self.multilingual_analyzer(text)[0]
+                result = self._predict_label_scores(self.multilingual_analyzer, [text])[0]
                 multilingual_result = self._normalize_transformer_result(result)
                 multilingual_result["method"] = "multilingual_transformer"
                 results.append(multilingual_result)
@@ -275,45 +391,51 @@ class SentimentAnalysisService:
                 }
             }
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Detect language if not provided
             if not language:
                 language = self._detect_language(text)
             
-            # Perform basic sentiment analysis
-            if language in self.south_indian_languages:
-                sentiment_result = self._analyze_south_indian_sentiment(text, language)
-            else:
-                # Use standard analysis for English and other languages
-                if self.method == "transformers":
-                    sentiment_result = self._analyze_with_transformers(text)
-                elif self.method == "vader":
-                    sentiment_result = self._analyze_with_vader(text)
-                elif self.method == "textblob":
-                    sentiment_result = self._analyze_with_textblob(text)
+            # Common short replies have a fixed sentiment and emotion and skip the models entirely
+            short_reply = self._get_short_reply(text)
+            sentiment_result = short_reply[0] if short_reply else None
+            
+            # Perform basic sentiment analysis, reusing the result for repeated texts
+            cache_key = None
+            if sentiment_result is None:
+                cache_key = self._get_cache_key(text, language)
+                sentiment_result = self._get_cached_result(cache_key)
+            if sentiment_result is None:
+                if language in self.south_indian_languages:
+                    sentiment_result = await asyncio.get_running_loop().run_in_executor(
+                        INFERENCE_POOL, self._analyze_south_indian_sentiment, text, language
+                    )
                 else:
-                    raise ValueError(f"Unknown sentiment analysis method: {self.method}")
+                    # Use standard analysis for English and other languages,
+                    # batched together with any concurrent requests
+                    sentiment_result = await self._analyze_batched(text)
+                self._cache_result(cache_key, sentiment_result)
             
             # Perform enhanced emotion analysis
-            emotion_result = await self.emotion_service.analyze_emotions(text, language)
+            if short_reply:
+                emotion_result = self.emotion_service.get_fixed_response(short_reply[1], language)
+            else:
+                emotion_result = await self.emotion_service.analyze_emotions(text, language)
             
             # Combine results
             result = {
                 **sentiment_result,
-                "processing_time": time.time() - start_time,
                 "language": language,
                 "language_name": self.south_indian_languages.get(language, language.upper()),
                 "emotions": emotion_result
             }
             
-            return result
-            
         except Exception as e:
             # Fallback to simple analysis
             print(f"Error in sentiment analysis: {e}")
-            return {
+            result = {
                 "sentiment": "neutral",
                 "confidence": 0.0,
                 "scores": {
@@ -321,7 +443,6 @@ class SentimentAnalysisService:
                     "negative": 0.0,
                     "neutral": 1.0
                 },
-                "processing_time": time.time() - start_time,
                 "language": language or "unknown",
                 "error": str(e),
                 "emotions": {
@@ -332,105 +453,258 @@ class SentimentAnalysisService:
                     "intensity": "low"
                 }
             }
+        
+        # Timed once for both the normal and the fallback result
+        result["processing_time"] = (time.perf_counter_ns() - start_ns) / 1e9
+        return result
     
-    def _normalize_transformer_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize transformer result to standard format"""
-        # Map labels to standard format
-        label_map = {
-            "LABEL_0": "negative",  # RoBERTa
-            "LABEL_1": "neutral",
-            "LABEL_2": "positive",
-            "NEGATIVE": "negative",  # Other models
-            "NEUTRAL": "neutral",
-            "POSITIVE": "positive"
-        }
+    def _get_short_reply(self, text: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Look up the fixed sentiment and emotion of a common short reply such as "ok" or "thanks!"
         
-        sentiment = label_map.get(result["label"], result["label"].lower())
-        confidence = result["score"]
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Sentiment result and emotion name, or None if the text isn't a known short reply
+        """
+        # Short replies are a few words at most; don't normalize longer texts just to miss
+        if len(text) > 32:
+            return None
+        key = " ".join(text.lower().split())
+        entry = SHORT_REPLY_SENTIMENTS.get(key) or SHORT_REPLY_SENTIMENTS.get(key.rstrip("!. "))
+        if entry is None:
+            return None
+        
+        *sentiment_scores, emotion = entry
+        scores = dict(zip(("positive", "negative", "neutral"), sentiment_scores))
+        sentiment = max(scores, key=scores.get)
+        return {
+            "sentiment": sentiment,
+            "confidence": scores[sentiment],
+            "scores": scores
+        }, emotion
+    
+    def _get_cache_key(self, text: str, language: str) -> Optional[tuple]:
+        """
+        Build the result cache key for a text
         
-        # Create scores dictionary
+        Args:
+            text: Text to analyze
+            language: Language code
+            
+        Returns:
+            Cache key, or None if the text should not be cached
+        """
+        if len(text) > MAX_CACHED_TEXT_LENGTH:
+            return None
+        # Case is kept because the transformer models are cased
+        return (language, " ".join(text.split()))
+    
+    def _get_cached_result(self, cache_key: Optional[tuple]) -> Optional[Dict[str, Any]]:
+        """Get a copy of a cached sentiment result, marking it as recently used"""
+        if cache_key is None or cache_key not in self._result_cache:
+            return None
+        self._result_cache.move_to_end(cache_key)
+        return copy.deepcopy(self._result_cache[cache_key])
+    
+    def _cache_result(self, cache_key: Optional[tuple], result: Dict[str, Any]):
+        """Store a sentiment result, evicting the least recently used one when full"""
+        if cache_key is None or self.cache_size <= 0:
+            return
+        self._result_cache[cache_key] = copy.deepcopy(result)
+        self._result_cache.move_to_end(cache_key)
+        if len(self._result_cache) > self.cache_size:
+            self._result_cache.popitem(last=False)
+    
+    def _normalize_transformer_result(self, result: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Normalize the transformer label distribution to standard format"""
+        # Create scores dictionary from the model's own probabilities
         scores = {"positive": 0.0, "negative": 0.0, "neutral": 0.0}
-        scores[sentiment] = confidence
+        for label_score in result:
+            scores[SENTIMENT_LABEL_MAP.get(label_score["label"], label_score["label"].lower())] = label_score["score"]
         
-        # Distribute remaining confidence
-        remaining = 1.0 - confidence
-        other_sentiments = [s for s in scores.keys() if s != sentiment]
-        for other in other_sentiments:
-            scores[other] = remaining / len(other_sentiments)
+        sentiment = max(scores, key=scores.get)
         
         return {
             "sentiment": sentiment,
-            "confidence": confidence,
+            "confidence": scores[sentiment],
             "scores": scores
         }
     
+    async def _analyze_batched(self, text: str) -> Dict[str, Any]:
+        """
+        Queue text for the batch worker and wait for its result
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Sentiment analysis result for this text
+        """
+        loop = asyncio.get_running_loop()
+        # A queue belongs to the loop it was created on, so a new loop needs its own
+        if self._batch_loop is not loop:
+            self._batch_queue = asyncio.Queue()
+            self._batch_loop = loop
+            self._batch_worker_task = None
+        # Restart the worker if it was cancelled or died, so queued texts don't wait forever
+        if self._batch_worker_task is None or self._batch_worker_task.done():
+            self._batch_worker_task = loop.create_task(self._batch_worker(self._batch_queue))
+        
+        future = loop.create_future()
+        await self._batch_queue.put((text, future))
+        return await future
+    
+    async def _batch_worker(self, queue: asyncio.Queue):
+        """Collect queued texts into batches and analyze each batch in one call"""
+        loop = asyncio.get_running_loop()
+        while True:
+            items = []
+            try:
+                items.append(await queue.get())
+                deadline = loop.time() + self.max_batch_delay
+                
+                # Keep collecting until the batch is full or the delay runs out
+                while len(items) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        items.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                
+                # The forward pass blocks, so it runs in the shared inference pool
+                results = await loop.run_in_executor(
+                    INFERENCE_POOL, self._analyze_batch, [text for text, _ in items]
+                )
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            except BaseException:
+                # Cancelled, e.g. at shutdown; don't leave this batch's callers waiting
+                for _, future in items:
+                    if not future.done():
+                        future.cancel()
+                raise
+            
+            for (_, future), result in zip(items, results):
+                if not future.done():
+                    future.set_result(result)
+    
+    def _analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Analyze a batch of texts with the configured method"""
+        if self._analyze_batch_fn is None:
+            raise ValueError(f"Unknown sentiment analysis method: {self.method}")
+        return self._analyze_batch_fn(texts)
+    
+    def _analyze_batch_with_transformers(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Analyze a batch of texts in a single forward pass of the transformer model"""
+        results = self._predict_label_scores(self.analyzer, texts)
+        return [self._normalize_transformer_result(result) for result in results]
+    
+    def _predict_label_scores(self, classifier, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Run the pipeline's model directly and return every label's probability
+        
+        Args:
+            classifier: Transformers sentiment-analysis pipeline
+            texts: Texts to classify
+            
+        Returns:
+            One list of {"label", "score"} dicts per text
+        """
+        # One batched call into the Rust tokenizer; repeated texts are served by the result cache
+        with self._tokenizer_lock:
+            inputs = classifier.tokenizer(texts, padding=True, truncation=True, return_tensors="pt")
+        inputs = {name: tensor.to(classifier.device, non_blocking=True) for name, tensor in inputs.items()}
+        
+        # No autograd bookkeeping, and FP16 activations on GPU
+        device_type = classifier.device.type
+        with torch.inference_mode(), torch.autocast(device_type=device_type, dtype=torch.float16,
+                                                    enabled=device_type == "cuda"):
+            logits = classifier.model(**inputs).logits
+        
+        # Softmax in FP32 so FP16 logits don't lose precision in the probabilities
+        probabilities = torch.softmax(logits.float(), dim=-1).cpu().tolist()
+        id2label = classifier.model.config.id2label
+        return [
+            [{"label": id2label[i], "score": score} for i, score in enumerate(row)]
+            for row in probabilities
+        ]
+    
     def _analyze_with_transformers(self, text: str) -> Dict[str, Any]:
         """Analyze sentiment using transformers pipeline"""
-        result = self.analyzer(text)[0]
-        return self._normalize_transformer_result(result)
+        return self._analyze_batch_with_transformers([text])[0]
     
-    def _analyze_with_vader(self, text: str) -> Dict[str, Any]:
-        """Analyze sentiment using VADER"""
-        scores = self.analyzer.polarity_scores(text)
+    def _analyze_batch_with_vader(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Analyze a batch of texts with VADER, scoring the whole batch as arrays"""
+        scores = self.vader_analyzer.score_batch(texts)
+        compound = scores["compound"]
         
         # Determine primary sentiment
-        if scores['compound'] >= 0.05:
-            sentiment = "positive"
-            confidence = scores['pos']
-        elif scores['compound'] <= -0.05:
-            sentiment = "negative"
-            confidence = scores['neg']
-        else:
-            sentiment = "neutral"
-            confidence = scores['neu']
-        
-        return {
-            "sentiment": sentiment,
-            "confidence": confidence,
-            "scores": {
-                "positive": scores['pos'],
-                "negative": scores['neg'],
-                "neutral": scores['neu']
+        is_positive = compound >= 0.05
+        is_negative = compound <= -0.05
+        sentiments = np.select([is_positive, is_negative], ["positive", "negative"], "neutral")
+        confidences = np.select([is_positive, is_negative], [scores["pos"], scores["neg"]], scores["neu"])
+        
+        return [
+            {
+                "sentiment": str(sentiment),
+                "confidence": float(confidence),
+                "scores": {
+                    "positive": float(pos),
+                    "negative": float(neg),
+                    "neutral": float(neu)
+                }
             }
-        }
+            for sentiment, confidence, pos, neg, neu in zip(
+                sentiments, confidences, scores["pos"], scores["neg"], scores["neu"]
+            )
+        ]
     
-    def _analyze_with_textblob(self, text: str) -> Dict[str, Any]:
-        """Analyze sentiment using TextBlob"""
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
+    def _analyze_with_vader(self, text: str) -> Dict[str, Any]:
+        """Analyze sentiment using VADER"""
+        return self._analyze_batch_with_vader([text])[0]
+    
+    def _analyze_batch_with_textblob(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Analyze a batch of texts with the TextBlob lexicon, scoring the whole batch as arrays"""
+        polarity = self.analyzer.polarity_batch(texts)
+        magnitude = np.abs(polarity)
         
         # Convert polarity to sentiment and confidence
-        if polarity > 0.1:
-            sentiment = "positive"
-            confidence = min(1.0, polarity)
-        elif polarity < -0.1:
-            sentiment = "negative"
-            confidence = min(1.0, abs(polarity))
-        else:
-            sentiment = "neutral"
-            confidence = 1.0 - abs(polarity)
-        
-        # Create normalized scores
-        pos_score = max(0.0, polarity)
-        neg_score = max(0.0, -polarity)
-        neu_score = 1.0 - abs(polarity)
-        
-        # Normalize scores to sum to 1
-        total = pos_score + neg_score + neu_score
-        if total > 0:
-            pos_score /= total
-            neg_score /= total
-            neu_score /= total
-        
-        return {
-            "sentiment": sentiment,
-            "confidence": confidence,
-            "scores": {
-                "positive": pos_score,
-                "negative": neg_score,
-                "neutral": neu_score
+        is_positive = polarity > 0.1
+        is_negative = polarity < -0.1
+        sentiments = np.select([is_positive, is_negative], ["positive", "negative"], "neutral")
+        confidences = np.where(is_positive | is_negative, np.minimum(1.0, magnitude), 1.0 - magnitude)
+        
+        # Create scores; with polarity in [-1, 1] they already sum to 1,
+        # since only one of positive/negative is non-zero and neutral is 1 - |polarity|
+        pos_scores = np.where(polarity > 0, polarity, 0.0)
+        neg_scores = np.where(polarity < 0, -polarity, 0.0)
+        neu_scores = 1.0 - magnitude
+        
+        return [
+            {
+                "sentiment": str(sentiment),
+                "confidence": float(confidence),
+                "scores": {
+                    "positive": float(pos),
+                    "negative": float(neg),
+                    "neutral": float(neu)
+                }
             }
-        }
+            for sentiment, confidence, pos, neg, neu in zip(
+                sentiments, confidences, pos_scores, neg_scores, neu_scores
+            )
+        ]
+    
+    def _analyze_with_textblob(self, text: str) -> Dict[str, Any]:
+        """Analyze sentiment using the TextBlob lexicon"""
+        return self._analyze_batch_with_textblob([text])[0]
     
     def get_analyzer_info(self) -> Dict[str, Any]:
         """Get information about the current analyzer"""
@@ -438,7 +712,9 @@ class SentimentAnalysisService:
         
         return {
             "method": self.method,
+            "model_name": self.model_name if self.method == "transformers" else None,
             "analyzer_loaded": self.analyzer is not None,
+            "cached_results": len(self._result_cache),
             "multilingual_support": self.multilingual_analyzer is not None,
             "supported_south_indian_languages": self.south_indian_languages,
             "supports_confidence": True,
@@ -1,19 +1,77 @@
-import whisper
+from faster_whisper import WhisperModel, BatchedInferencePipeline, decode_audio
+from faster_whisper.feature_extractor import FeatureExtractor
+import asyncio
+import threading
 import time
 import os
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+import numpy as np
 import torch
+from .inference_pool import INFERENCE_POOL
+
+# Whisper works on 16 kHz audio in 30 second windows
+SAMPLE_RATE = 16000
+WINDOW_SECONDS = 30
+
+# Loaded Whisper models, shared by all service instances and keyed by model size
+_MODEL_CACHE: Dict[str, WhisperModel] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+class TorchFeatureExtractor(FeatureExtractor):
+    """
+    faster-whisper feature extractor that computes the log-Mel spectrogram with
+    torch on the model's device instead of with NumPy on the CPU
+    """
+    
+    def __init__(self, device: str = "cuda", **kwargs):
+        super().__init__(**kwargs)
+        self.device = device
+        self.window = torch.hann_window(self.n_fft, device=device)
+        self.mel_filters_tensor = torch.from_numpy(self.mel_filters).to(device)
+    
+    def __call__(self, waveform: np.ndarray, padding=160, chunk_length=None):
+        """Compute the log-Mel spectrogram of the provided audio"""
+        if chunk_length is not None:
+            self.n_samples = chunk_length * self.sampling_rate
+            self.nb_max_frames = self.n_samples // self.hop_length
+        
+        # Only the raw samples are copied to the device, and only the spectrogram comes back
+        waveform = torch.from_numpy(np.asarray(waveform, dtype=np.float32)).to(self.device)
+        if padding:
+            waveform = torch.nn.functional.pad(waveform, (0, padding))
+        
+        with torch.inference_mode():
+            stft = torch.stft(waveform, self.n_fft, self.hop_length, window=self.window,
+                              return_complex=True)
+            magnitudes = stft[..., :-1].abs() ** 2
+            
+            mel_spec = self.mel_filters_tensor @ magnitudes
+            
+            log_spec = torch.clamp(mel_spec, min=1e-10).log10()
+            log_spec = torch.maximum(log_spec, log_spec.max() - 8.0)
+            log_spec = (log_spec + 4.0) / 4.0
+        
+        # The CTranslate2 model and faster-whisper's windowing expect a NumPy array
+        return log_spec.cpu().numpy()
 
 class SpeechToTextService:
-    def __init__(self, model_size: str = "base"):
+    def __init__(self, model_size: str = "base", batch_size: int = 8,
+                 default_language: Optional[str] = None):
         """
-        Initialize the Speech-to-Text service using OpenAI Whisper
+        Initialize the Speech-to-Text service using Whisper on the CTranslate2 backend
         
         Args:
             model_size: Whisper model size ("tiny", "base", "small", "medium", "large")
+            batch_size: Number of speech chunks decoded together for long audio
+            default_language: Language code used when a request doesn't give one,
+                skipping auto-detection (e.g. 'ta' for a Tamil-only deployment)
         """
         self.model_size = model_size
-        self.model = None
+        self.batch_size = batch_size
+        self.default_language = default_language
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        # INT8 weights; activations stay FP16 on GPU
+        self.compute_type = "int8_float16" if self.device == "cuda" else "int8"
         self.supported_south_indian_languages = {
             'ta': 'Tamil',
             'te': 'Telugu', 
@@ -22,15 +80,46 @@ class SpeechToTextService:
         }
         self._load_model()
     
-    def _load_model(self):
-        """Load the Whisper model"""
-        try:
-            print(f"Loading Whisper model: {self.model_size}")
-            self.model = whisper.load_model(self.model_size)
-            print("Model loaded successfully!")
-        except Exception as e:
-            print(f"Error loading Whisper model: {e}")
-            raise e
+    @property
+    def model(self) -> WhisperModel:
+        """Whisper model for the current model size, loaded on first use"""
+        model = _MODEL_CACHE.get(self.model_size)
+        if model is None:
+            model = self._load_model()
+        return model
+    
+    def _load_model(self) -> WhisperModel:
+        """Load the Whisper model for the current model size, unless it is already cached"""
+        model_size = self.model_size
+        with _MODEL_CACHE_LOCK:
+            if model_size in _MODEL_CACHE:
+                return _MODEL_CACHE[model_size]
+            try:
+                print(f"Loading Whisper model: {model_size} ({self.device}, {self.compute_type})")
+                model = WhisperModel(
+                    model_size,
+                    device=self.device,
+                    compute_type=self.compute_type
+                )
+                if self.device == "cuda":
+                    # Mel spectrogram on the GPU instead of a NumPy STFT on the CPU
+                    model.feature_extractor = TorchFeatureExtractor(self.device, **model.feat_kwargs)
+                self._warm_up_model(model)
+                _MODEL_CACHE[model_size] = model
+                print("Model loaded successfully!")
+                return model
+            except Exception as e:
+                print(f"Error loading Whisper model: {e}")
+                raise e
+    
+    def _warm_up_model(self, model: WhisperModel):
+        """
+        Run one short decode so device buffers and kernels are initialized at
+        load time instead of on the first request
+        """
+        silence = np.zeros(SAMPLE_RATE, dtype=np.float32)  # 1 second
+        segments, _ = model.transcribe(silence, language="en", beam_size=1)
+        list(segments)  # Segments are lazy; consume them to actually run the decoder
     
     def detect_language(self, audio_file_path: str) -> Dict[str, Any]:
         """
@@ -43,22 +132,36 @@ class SpeechToTextService:
             Dictionary containing detected language and confidence
         """
         try:
-            # Load audio and pad/trim it to fit 30 seconds
-            audio = whisper.load_audio(audio_file_path)
-            audio = whisper.pad_or_trim(audio)
-            
-            # Make log-Mel spectrogram and move to the same device as the model
-            mel = whisper.log_mel_spectrogram(audio).to(self.model.device)
+            # Load audio as 16 kHz mono; detection only looks at the first 30 seconds
+            audio = decode_audio(audio_file_path, sampling_rate=SAMPLE_RATE)
+        except Exception as e:
+            print(f"Error detecting language: {e}")
+            return {
+                "language": "en",
+                "confidence": 0.5,
+                "all_probabilities": {"en": 0.5}
+            }
+        
+        return self._detect_audio_language(audio)
+    
+    def _detect_audio_language(self, audio: np.ndarray) -> Dict[str, Any]:
+        """
+        Detect the language of already decoded audio
+        
+        Args:
+            audio: 16 kHz mono audio samples
             
+        Returns:
+            Dictionary containing detected language and confidence
+        """
+        try:
             # Detect the spoken language
-            _, probs = self.model.detect_language(mel)
-            detected_language = max(probs, key=probs.get)
-            confidence = probs[detected_language]
+            detected_language, confidence, probs = self.model.detect_language(audio)
             
             return {
                 "language": detected_language,
                 "confidence": confidence,
-                "all_probabilities": dict(sorted(probs.items(), key=lambda x: x[1], reverse=True)[:5])
+                "all_probabilities": dict(sorted(probs, key=lambda x: x[1], reverse=True)[:5])
             }
         except Exception as e:
             print(f"Error detecting language: {e}")
@@ -75,8 +178,9 @@ class SpeechToTextService:
         
         Args:
             audio_file_path: Path to the audio file
-            language_code: Optional language code (e.g., 'ta' for Tamil)
-            auto_detect: Whether to auto-detect language if not specified
+            language_code: Optional language code (e.g., 'ta' for Tamil), defaults to
+                the service's default_language
+            auto_detect: Whether to auto-detect language if neither is set
             
         Returns:
             Dictionary containing transcript and metadata
@@ -85,26 +189,19 @@ class SpeechToTextService:
             raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
         
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
+            loop = asyncio.get_running_loop()
             
-            # Auto-detect language if not specified
-            detected_language_info = None
-            if auto_detect and not language_code:
-                detected_language_info = self.detect_language(audio_file_path)
-                language_code = detected_language_info["language"]
-                print(f"Auto-detected language: {language_code} (confidence: {detected_language_info['confidence']:.2f})")
+            # Load a newly selected model off the event loop so other requests keep being served
+            if self.model_size not in _MODEL_CACHE:
+                await loop.run_in_executor(None, self._load_model)
             
-            # Use appropriate transcription settings based on language
-            transcription_options = self._get_transcription_options(language_code)
-            
-            # Transcribe using Whisper with optimized settings
-            result = self.model.transcribe(
-                audio_file_path,
-                language=language_code,
-                **transcription_options
+            # Decoding and transcription block, so they run in the shared inference pool
+            result, language_code, detected_language_info = await loop.run_in_executor(
+                INFERENCE_POOL, self._run_transcription, audio_file_path, language_code, auto_detect
             )
             
-            processing_time = time.time() - start_time
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             # Post-process text for South Indian languages
             processed_text = self._post_process_text(result["text"], language_code)
@@ -124,6 +221,62 @@ class SpeechToTextService:
         except Exception as e:
             raise Exception(f"Error during transcription: {str(e)}")
     
+    def _run_transcription(self, audio_file_path: str, language_code: Optional[str],
+                           auto_detect: bool) -> Tuple[Dict[str, Any], Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Decode and transcribe the audio file, detecting the language if needed
+        
+        Args:
+            audio_file_path: Path to the audio file
+            language_code: Optional language code
+            auto_detect: Whether to auto-detect language if none is set
+            
+        Returns:
+            Tuple of the raw transcription result, the language used and the detection info
+        """
+        # Decode once; detection and transcription both work on the same samples
+        audio = decode_audio(audio_file_path, sampling_rate=SAMPLE_RATE)
+        
+        # A known language skips the detection pass entirely
+        language_code = language_code or self.default_language
+        
+        # Auto-detect language if not specified
+        detected_language_info = None
+        if auto_detect and not language_code:
+            detected_language_info = self._detect_audio_language(audio)
+            language_code = detected_language_info["language"]
+            print(f"Auto-detected language: {language_code} (confidence: {detected_language_info['confidence']:.2f})")
+        
+        # Use appropriate transcription settings based on language
+        transcription_options = self._get_transcription_options(language_code)
+        
+        # Transcribe using Whisper with optimized settings; segments are decoded lazily.
+        # Audio longer than one window is split on speech and its chunks decoded in batches.
+        if len(audio) > WINDOW_SECONDS * SAMPLE_RATE:
+            # The pipeline keeps per-call state, so each long transcription gets its own
+            batched_model = BatchedInferencePipeline(model=self.model)
+            segments, info = batched_model.transcribe(
+                audio,
+                language=language_code,
+                batch_size=self.batch_size,
+                **transcription_options
+            )
+        else:
+            segments, info = self.model.transcribe(
+                audio,
+                language=language_code,
+                **transcription_options
+            )
+        
+        # Segments are lazy; converting them here runs the decoder inside this thread
+        segments = [self._segment_to_dict(segment) for segment in segments]
+        result = {
+            "text": "".join(segment["text"] for segment in segments),
+            "segments": segments,
+            "language": info.language
+        }
+        return result, language_code, detected_language_info
+    
     def _get_transcription_options(self, language_code: Optional[str]) -> Dict[str, Any]:
         """
         Get optimized transcription options based on language
@@ -135,10 +288,12 @@ class SpeechToTextService:
             Dictionary of transcription options
         """
         base_options = {
-            "fp16": torch.cuda.is_available(),
             "task": "transcribe",
-            "verbose": False,
+            "beam_size": 1,  # Greedy decoding unless a language asks for beam search
             "temperature": 0.0,  # Use deterministic decoding for better consistency
+            "vad_filter": True,  # Skip silence so the decoder only runs on speech
+            "best_of": 1,
+            "condition_on_previous_text": False,  # Decode each window without the previous text as prompt
         }
         
         # Enhanced options for South Indian languages
@@ -230,6 +385,27 @@ class SpeechToTextService:
         
         return text
     
+    def _segment_to_dict(self, segment) -> Dict[str, Any]:
+        """
+        Convert a faster-whisper segment into the dict shape used in results
+        
+        Args:
+            segment: Segment yielded by WhisperModel.transcribe
+            
+        Returns:
+            Segment as a plain dictionary
+        """
+        return {
+            "id": segment.id,
+            "start": segment.start,
+            "end": segment.end,
+            "text": segment.text,
+            "avg_logprob": segment.avg_logprob,
+            "no_speech_prob": segment.no_speech_prob,
+            "compression_ratio": segment.compression_ratio,
+            "temperature": segment.temperature
+        }
+    
     def _calculate_confidence(self, result: Dict[str, Any]) -> float:
         """
         Calculate average confidence from Whisper segments with enhanced logic
@@ -275,7 +451,11 @@ class SpeechToTextService:
         """Get information about the loaded model"""
         return {
             "model_size": self.model_size,
-            "model_loaded": self.model is not None,
+            "model_loaded": self.model_size in _MODEL_CACHE,
+            "backend": "faster-whisper",
+            "device": self.device,
+            "compute_type": self.compute_type,
+            "default_language": self.default_language,
             "cuda_available": torch.cuda.is_available(),
             "supported_languages": [
                 "en", "zh", "de", "es", "ru", "ko", "fr", "ja", "pt", "tr",
@@ -290,15 +470,21 @@ class SpeechToTextService:
                 "Language-specific optimization",
                 "Post-processing for South Indian languages",
                 "Confidence scoring",
-                "Beam search for quality"
+                "Beam search for quality",
+                "INT8 CTranslate2 inference",
+                "Batched decoding for long audio",
+                "Voice activity filtering"
             ]
         }
     
     def change_model(self, model_size: str):
-        """Change the Whisper model size"""
-        if model_size != self.model_size:
-            self.model_size = model_size
-            self._load_model()
+        """
+        Change the Whisper model size
+        
+        The model is loaded on first use, and previously loaded sizes are reused
+        from the shared cache, so switching back and forth doesn't reload.
+        """
+        self.model_size = model_size
     
     def get_supported_south_indian_languages(self) -> Dict[str, str]:
         """Get list of supported South Indian languages"""
@@ -314,8 +500,10 @@ class SpeechToTextService:
         Returns:
             Dictionary containing transcript and detailed language information
         """
-        # First detect the language
-        language_info = self.detect_language(audio_file_path)
+        # First detect the language, off the event loop
+        language_info = await asyncio.get_running_loop().run_in_executor(
+            INFERENCE_POOL, self.detect_language, audio_file_path
+        )
         detected_language = language_info["language"]
         
         # Transcribe with the detected language
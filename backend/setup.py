@@ -114,12 +114,12 @@ def download_models():
     
     # Download Whisper model
     download_script = """
-import whisper
+from faster_whisper import WhisperModel
 import transformers
 
 print("Downloading Whisper base model...")
 try:
-    model = whisper.load_model("base")
+    model = WhisperModel("base", device="cpu", compute_type="int8")
     print("Whisper model downloaded successfully!")
 except Exception as e:
     print(f"Error downloading Whisper model: {e}")
@@ -128,7 +128,7 @@ print("Downloading sentiment analysis model...")
 try:
     from transformers import pipeline
     sentiment_pipeline = pipeline("sentiment-analysis", 
-                                model="cardiffnlp/twitter-roberta-base-sentiment-latest")
+                                model="lxyuan/distilbert-base-multilingual-cased-sentiments-student")
     print("Sentiment model downloaded successfully!")
 except Exception as e:
     print(f"Error downloading sentiment model: {e}")
@@ -156,6 +156,7 @@ MAX_FILE_SIZE=50MB
 STT_METHOD=whisper
 WHISPER_MODEL_SIZE=base
 SENTIMENT_METHOD=transformers
+SENTIMENT_MODEL=lxyuan/distilbert-base-multilingual-cased-sentiments-student
 ALLOWED_ORIGINS=http://localhost:3000,http://localhost:8080
 """)
         print(".env file created successfully!")
@@ -178,7 +179,7 @@ except ImportError as e:
     print(f" FastAPI import failed: {e}")
 
 try:
-    import whisper
+    import faster_whisper
     print(" Whisper imported successfully")
 except ImportError as e:
     print(f" Whisper import failed: {e}")
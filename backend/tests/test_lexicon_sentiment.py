@@ -0,0 +1,74 @@
+import pytest
+
+vader = pytest.importorskip("vaderSentiment.vaderSentiment")
+
+from services.lexicon_sentiment import FastSentimentIntensityAnalyzer
+
+PARITY_SENTENCES = [
+    "no problem at all",
+    "it was no fun",
+    "least helpful",
+    "at least it works",
+    "He is no good or nice",
+    ":)",
+    ":(",
+    "Make sure you :) or :D today!",
+    "😂",
+    "Catch utf-8 emoji such as 💘 and 💋 and 😁",
+    "The book was kind of good.",
+    "This movie is great!!",
+    "VADER is VERY SMART, handsome, and FUNNY!!!",
+    "Today SUX!",
+    "I don't like this ugly thing",
+    "Not bad at all",
+    "never so happy",
+    "without doubt the best",
+    "It was the shit!",
+    "yeah right, this is so great",
+    "The food was not very good, but the service was great",
+    "good good good but bad bad",
+    "I never had such a bad day ??",
+    "meh",
+    "...",
+    "",
+]
+
+@pytest.fixture(scope="module")
+def analyzers():
+    return FastSentimentIntensityAnalyzer(), vader.SentimentIntensityAnalyzer()
+
+@pytest.mark.parametrize("text", PARITY_SENTENCES)
+def test_polarity_scores_match_vader(analyzers, text):
+    fast, reference = analyzers
+    assert fast.polarity_scores(text) == reference.polarity_scores(text)
+
+def test_score_batch_matches_single_texts(analyzers):
+    fast, reference = analyzers
+    scores = fast.score_batch(PARITY_SENTENCES)
+    for index, text in enumerate(PARITY_SENTENCES):
+        expected = reference.polarity_scores(text)
+        assert {name: float(values[index]) for name, values in scores.items()} == expected
+
+TEXTBLOB_SENTENCES = [
+    "very good",
+    "very very good",
+    "extremely bad service",
+    "The food was terrible... but the staff were really nice!",
+    "I don't like it, not good!",
+    "not a good movie",
+    "really not good",
+    "It is NOT bad!!",
+    "This is awesome",
+    "pretty bad movie, e.g. the ending",
+    "no idea what is going on",
+    "very",
+    "",
+]
+
+@pytest.mark.parametrize("text", TEXTBLOB_SENTENCES)
+def test_polarity_matches_textblob(text):
+    textblob = pytest.importorskip("textblob")
+    from services.lexicon_sentiment import LexiconPolarityAnalyzer
+
+    analyzer = LexiconPolarityAnalyzer()
+    assert analyzer.polarity_scores(text) == pytest.approx(textblob.TextBlob(text).sentiment.polarity)
@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+pytest.importorskip("vaderSentiment")
+
+from services.enhanced_emotion_analysis import EnhancedEmotionAnalysisService
+from services.sentiment_analysis import SentimentAnalysisService
+
+@pytest.fixture
+def service(monkeypatch):
+    # Keep the emotion service to its keyword analysis instead of downloading models
+    monkeypatch.setattr(EnhancedEmotionAnalysisService, "_load_enhanced_analyzers", lambda self: None)
+    return SentimentAnalysisService(method="vader")
+
+def test_analyze_sentiment_across_event_loops(service):
+    async def analyze(text):
+        return await asyncio.wait_for(service.analyze_sentiment(text, "en"), timeout=10)
+
+    first = asyncio.run(analyze("The food was really great"))
+    second = asyncio.run(analyze("The service was really terrible"))
+
+    assert first["sentiment"] == "positive"
+    assert second["sentiment"] == "negative"
+
+def test_batch_worker_restarts_after_cancellation(service):
+    async def analyze_after_cancel():
+        await service.analyze_sentiment("The food was really great", "en")
+        service._batch_worker_task.cancel()
+        await asyncio.sleep(0)
+        return await asyncio.wait_for(service.analyze_sentiment("The service was really terrible", "en"), timeout=10)
+
+    assert asyncio.run(analyze_after_cancel())["sentiment"] == "negative"
@@ -0,0 +1,18 @@
+import pytest
+
+transformers = pytest.importorskip("transformers")
+
+from services.sentiment_analysis import DEFAULT_SENTIMENT_MODEL, SENTIMENT_LABEL_MAP
+
+@pytest.mark.parametrize("model_name", [
+    DEFAULT_SENTIMENT_MODEL,
+    "cardiffnlp/twitter-xlm-roberta-base-sentiment"
+])
+def test_model_labels_map_to_standard_sentiments(model_name):
+    try:
+        config = transformers.AutoConfig.from_pretrained(model_name)
+    except OSError as e:
+        pytest.skip(f"Model config for {model_name} is not available: {e}")
+
+    labels = {SENTIMENT_LABEL_MAP.get(label, label.lower()) for label in config.id2label.values()}
+    assert labels == {"positive", "negative", "neutral"}
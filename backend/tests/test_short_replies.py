@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip("vaderSentiment")
+
+from services.lexicon_sentiment import SHORT_REPLY_SENTIMENTS
+
+@pytest.mark.parametrize("text, sentiment, emotion", [
+    ("thanks", "positive", "gratitude"),
+    ("love it", "positive", "love"),
+    ("great job", "positive", "pride"),
+    ("hello", "neutral", "mildness"),
+    ("meh", "neutral", "boredom"),
+    ("sad", "negative", "sad"),
+    ("😭", "negative", "sad"),
+    ("angry", "negative", "angry"),
+    ("boring", "negative", "boredom"),
+    ("i hate it", "negative", "hate")
+])
+def test_short_reply_sentiment_and_emotion(text, sentiment, emotion):
+    *scores, entry_emotion = SHORT_REPLY_SENTIMENTS[text]
+    labels = dict(zip(("positive", "negative", "neutral"), scores))
+    assert max(labels, key=labels.get) == sentiment
+    assert entry_emotion == emotion
+
+def test_short_replies_leave_negations_to_the_analyzers():
+    assert not [text for text in SHORT_REPLY_SENTIMENTS if "not " in text or "n't" in text]